@@ -1,8 +1,11 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File, Form, HTTPException, Depends
 from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
 from app.models.message import Message
+from app.services.cache_service import rate_limit
+from app.services.event_service import publish_message_event
 from app.services.gemini_service import translate_text, transcribe_audio
+from app.services.vector_index_service import index_message
 import uuid
 import os
 from pathlib import Path
@@ -19,8 +22,9 @@ def get_db():
     finally:
         db.close()
 
-@router.post("")
+@router.post("", dependencies=[Depends(rate_limit)])
 async def upload_audio(
+    background_tasks: BackgroundTasks,
     conversation_id: str = Form(...),
     role: str = Form(...),
     source_language: str = Form(...),
@@ -92,17 +96,29 @@ async def upload_audio(
             db.commit()
             db.refresh(msg)
             
-            return {
-                "message": {
-                    "id": msg.id,
-                    "conversation_id": msg.conversation_id,
-                    "role": msg.role,
-                    "original_text": msg.original_text,
-                    "translated_text": msg.translated_text,
-                    "audio_path": msg.audio_path,
-                    "timestamp": msg.created_at.isoformat() if msg.created_at else None
-                }
+            # Embed for semantic search after the response is sent
+            background_tasks.add_task(
+                index_message,
+                msg.id,
+                msg.conversation_id,
+                msg.original_text,
+                msg.translated_text
+            )
+            
+            message = {
+                "id": msg.id,
+                "conversation_id": msg.conversation_id,
+                "role": msg.role,
+                "original_text": msg.original_text,
+                "translated_text": msg.translated_text,
+                "audio_path": msg.audio_path,
+                "timestamp": msg.created_at.isoformat() if msg.created_at else None
             }
+            
+            # Deliver to event stream listeners on every worker
+            background_tasks.add_task(publish_message_event, message)
+            
+            return {"message": message}
         except Exception as e:
             db.rollback()
             os.remove(file_path)
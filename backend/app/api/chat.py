@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
 from app.models.message import Message
+from app.services.cache_service import rate_limit
+from app.services.event_service import conversation_channel, get_event_bus, publish_message_event
 from app.services.gemini_service import translate_text
+from app.services.vector_index_service import index_message
 from app.schemas.message_schema import MessageCreate, MessageResponse
+import json
 
 router = APIRouter(prefix="/messages", tags=["Chat"])
 
@@ -14,8 +19,15 @@ def get_db():
     finally:
         db.close()
 
-@router.post("")
-def send_message(data: MessageCreate, db: Session = Depends(get_db)):
+# Seconds between keep-alive comments on idle event streams
+EVENT_STREAM_KEEPALIVE = 15
+
+@router.post("", dependencies=[Depends(rate_limit)])
+def send_message(
+    data: MessageCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """
     Send a message and get real-time translation.
     
@@ -53,17 +65,29 @@ def send_message(data: MessageCreate, db: Session = Depends(get_db)):
         db.commit()
         db.refresh(msg)
 
-        return {
-            "message": {
-                "id": msg.id,
-                "conversation_id": msg.conversation_id,
-                "role": msg.role,
-                "original_text": msg.original_text,
-                "translated_text": msg.translated_text,
-                "audio_path": msg.audio_path,
-                "timestamp": msg.created_at.isoformat() if msg.created_at else None
-            }
+        # Embed for semantic search after the response is sent
+        background_tasks.add_task(
+            index_message,
+            msg.id,
+            msg.conversation_id,
+            msg.original_text,
+            msg.translated_text
+        )
+
+        message = {
+            "id": msg.id,
+            "conversation_id": msg.conversation_id,
+            "role": msg.role,
+            "original_text": msg.original_text,
+            "translated_text": msg.translated_text,
+            "audio_path": msg.audio_path,
+            "timestamp": msg.created_at.isoformat() if msg.created_at else None
         }
+
+        # Deliver to event stream listeners on every worker
+        background_tasks.add_task(publish_message_event, message)
+
+        return {"message": message}
         
     except HTTPException:
         raise
@@ -100,3 +124,28 @@ def get_conversation_messages(conversation_id: str, db: Session = Depends(get_db
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving messages: {str(e)}")
+
+@router.get("/{conversation_id}/events")
+async def stream_conversation_events(conversation_id: str, request: Request):
+    """
+    Stream new messages in a conversation as Server-Sent Events.
+    Messages saved by any worker are delivered.
+    """
+    subscription = get_event_bus().subscribe(conversation_channel(conversation_id))
+
+    async def event_stream():
+        try:
+            while not await request.is_disconnected():
+                event = await subscription.get(timeout=EVENT_STREAM_KEEPALIVE)
+                if event is None:
+                    yield ": keep-alive\n\n"
+                else:
+                    yield f"event: {event['type']}\ndata: {json.dumps(event['message'])}\n\n"
+        finally:
+            await subscription.close()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
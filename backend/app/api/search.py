@@ -1,7 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
 from app.models.message import Message
+from app.services.embedding_service import embed_texts
+from app.services.vector_index_service import (
+    SEMANTIC_SEARCH_ENABLED,
+    backfill_index,
+    get_vector_index,
+)
+import time
 
 router = APIRouter(prefix="/search", tags=["Search"])
 
@@ -74,6 +81,105 @@ def search_messages(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching messages: {str(e)}")
 
+@router.get("/semantic")
+def semantic_search(
+    query: str,
+    conversation_id: str = None,
+    top_k: int = 10,
+    min_score: float = 0.0,
+    db: Session = Depends(get_db)
+):
+    """
+    Search for messages by meaning using the local vector index.
+    
+    Query Parameters:
+    - query: Search text (required) - matched against original and translated text
+    - conversation_id: Optional filter for specific conversation
+    - top_k: Maximum number of ranked results (1-100, default: 10)
+    - min_score: Only return hits scoring above this similarity (-1 to 1, default: 0)
+    """
+    try:
+        if not SEMANTIC_SEARCH_ENABLED:
+            raise HTTPException(status_code=503, detail="Semantic search is disabled")
+        
+        if not query or not query.strip():
+            raise HTTPException(status_code=400, detail="Query parameter is required")
+        
+        if top_k < 1 or top_k > 100:
+            raise HTTPException(status_code=400, detail="top_k must be between 1 and 100")
+        
+        if min_score < -1 or min_score > 1:
+            raise HTTPException(status_code=400, detail="min_score must be between -1 and 1")
+        
+        started = time.perf_counter()
+        query_vector = embed_texts([query])
+        embedded = time.perf_counter()
+        
+        # A query with no word tokens embeds to a zero vector and matches nothing
+        hits = []
+        if query_vector.any():
+            hits = get_vector_index().search(query_vector, top_k, conversation_id, min_score)[0]
+        searched = time.perf_counter()
+        
+        # Load matched messages, results keep the ranking order from the index
+        hit_ids = [message_id for message_id, _ in hits]
+        messages = {}
+        if hit_ids:
+            messages = {
+                msg.id: msg
+                for msg in db.query(Message).filter(Message.id.in_(hit_ids)).all()
+            }
+        fetched = time.perf_counter()
+        
+        results = []
+        for message_id, score in hits:
+            msg = messages.get(message_id)
+            if not msg:
+                continue  # Indexed message no longer in the database
+            results.append({
+                "id": msg.id,
+                "conversation_id": msg.conversation_id,
+                "role": msg.role,
+                "original_text": msg.original_text,
+                "translated_text": msg.translated_text,
+                "audio_path": msg.audio_path,
+                "timestamp": msg.created_at.isoformat() if msg.created_at else None,
+                "score": round(score, 4)
+            })
+        
+        return {
+            "query": query,
+            "conversation_id": conversation_id,
+            "mode": "semantic",
+            "results": results,
+            "total": len(results),
+            "latency_ms": {
+                "embed": round((embedded - started) * 1000, 3),
+                "search": round((searched - embedded) * 1000, 3),
+                "fetch": round((fetched - searched) * 1000, 3),
+                "total": round((fetched - started) * 1000, 3)
+            }
+        }
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching messages: {str(e)}")
+
+@router.post("/semantic/reindex")
+def reindex_messages(background_tasks: BackgroundTasks):
+    """
+    Embed any stored messages missing from the semantic index, in the background.
+    """
+    if not SEMANTIC_SEARCH_ENABLED:
+        raise HTTPException(status_code=503, detail="Semantic search is disabled")
+    
+    background_tasks.add_task(backfill_index)
+    return {
+        "status": "started",
+        "indexed_messages": len(get_vector_index())
+    }
+
 @router.get("/conversation/{conversation_id}")
 def search_conversation(
     conversation_id: str,
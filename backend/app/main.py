@@ -1,19 +1,30 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import os
+import threading
 
 from app.api import chat, audio, search, summary
 from app.db.session import engine
 from app.db.base import Base
+from app.services.vector_index_service import SEMANTIC_SEARCH_ENABLED, backfill_index
 
 # Create tables
 Base.metadata.create_all(bind=engine)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Index messages written before semantic search was enabled
+    if SEMANTIC_SEARCH_ENABLED:
+        threading.Thread(target=backfill_index, daemon=True).start()
+    yield
+
 app = FastAPI(
     title="Healthcare Conversation Translator",
     description="Real-time translation and AI-powered summarization for doctor-patient conversations",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Enable CORS for frontend communication
@@ -0,0 +1,261 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from fastapi import HTTPException, Request
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# memory:// (single worker), sqlite:///path (shared by workers on one machine)
+# or redis://host:port/db (shared across workers and nodes)
+CACHE_URL = os.getenv("CACHE_URL", "memory://")
+RATE_LIMIT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PER_MINUTE", "0"))
+MEMORY_CACHE_MAX_ENTRIES = int(os.getenv("MEMORY_CACHE_MAX_ENTRIES", "10000"))
+
+class CacheBackend:
+    """
+    Key/value store for caches and rate limits.
+    Values must be JSON-serializable; ttl is in seconds.
+    """
+
+    def get(self, key: str):
+        raise NotImplementedError
+
+    def set(self, key: str, value, ttl: float = None):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def incr(self, key: str, amount: int = 1, ttl: float = None) -> int:
+        """
+        Atomically add to a counter and return the new value.
+        The ttl is applied when the counter is created.
+        """
+        raise NotImplementedError
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU cache. Each worker gets its own copy.
+    Expired keys are swept on writes and the least recently used keys are
+    evicted beyond `max_entries`, so memory stays bounded.
+    """
+
+    def __init__(self, max_entries: int = MEMORY_CACHE_MAX_ENTRIES, sweep_interval: float = 60):
+        self.lock = threading.Lock()
+        self.data = OrderedDict()
+        self.max_entries = max_entries
+        self.sweep_interval = sweep_interval
+        self._last_sweep = time.time()
+
+    def _live(self, key: str):
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        if entry[1] is not None and entry[1] <= time.time():
+            del self.data[key]
+            return None
+        self.data.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, value, expires_at):
+        self.data[key] = (value, expires_at)
+        self.data.move_to_end(key)
+
+        now = time.time()
+        if now - self._last_sweep > self.sweep_interval:
+            expired = [
+                k for k, (_, expires_at) in self.data.items()
+                if expires_at is not None and expires_at <= now
+            ]
+            for k in expired:
+                del self.data[k]
+            self._last_sweep = now
+
+        while len(self.data) > self.max_entries:
+            self.data.popitem(last=False)
+
+    def get(self, key: str):
+        with self.lock:
+            entry = self._live(key)
+            return entry[0] if entry else None
+
+    def set(self, key: str, value, ttl: float = None):
+        with self.lock:
+            self._store(key, value, time.time() + ttl if ttl else None)
+
+    def delete(self, key: str):
+        with self.lock:
+            self.data.pop(key, None)
+
+    def incr(self, key: str, amount: int = 1, ttl: float = None) -> int:
+        with self.lock:
+            entry = self._live(key)
+            if entry:
+                value, expires_at = entry[0] + amount, entry[1]
+            else:
+                value, expires_at = amount, time.time() + ttl if ttl else None
+            self._store(key, value, expires_at)
+            return value
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Cache in a local SQLite file, shared by every worker on the same machine.
+    Expired rows are swept on writes so the file stays bounded.
+    """
+
+    def __init__(self, path: str, sweep_interval: float = 60):
+        self.lock = threading.Lock()
+        self.sweep_interval = sweep_interval
+        self._last_sweep = time.time()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, expires_at REAL)"
+        )
+
+    def get(self, key: str):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _sweep(self, now: float):
+        # Caller holds self.lock
+        if now - self._last_sweep > self.sweep_interval:
+            self.conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            self._last_sweep = now
+
+    def set(self, key: str, value, ttl: float = None):
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), now + ttl if ttl else None)
+            )
+            self._sweep(now)
+
+    def delete(self, key: str):
+        with self.lock:
+            self.conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def incr(self, key: str, amount: int = 1, ttl: float = None) -> int:
+        now = time.time()
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.conn.execute(
+                    "SELECT value FROM cache WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                    (key, now)
+                ).fetchone()
+                if row:
+                    value = json.loads(row[0]) + amount
+                    self.conn.execute("UPDATE cache SET value = ? WHERE key = ?", (json.dumps(value), key))
+                else:
+                    value = amount
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                        (key, json.dumps(value), now + ttl if ttl else None)
+                    )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self._sweep(now)
+        return value
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache in Redis (or any Redis-compatible server), shared across nodes.
+    """
+
+    def __init__(self, url: str):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+
+    def get(self, key: str):
+        value = self.client.get(key)
+        return json.loads(value) if value is not None else None
+
+    def set(self, key: str, value, ttl: float = None):
+        self.client.set(key, json.dumps(value), px=int(ttl * 1000) if ttl else None)
+
+    def delete(self, key: str):
+        self.client.delete(key)
+
+    def incr(self, key: str, amount: int = 1, ttl: float = None) -> int:
+        if not ttl:
+            return self.client.incrby(key, amount)
+        # Create the key with its expiry first (no-op if it exists), in one
+        # MULTI/EXEC so a counter can never be left without a ttl
+        pipeline = self.client.pipeline(transaction=True)
+        pipeline.set(key, 0, px=int(ttl * 1000), nx=True)
+        pipeline.incrby(key, amount)
+        return pipeline.execute()[1]
+
+def create_cache_backend(url: str) -> CacheBackend:
+    """
+    Build a cache backend from a URL: memory://, sqlite:///path or redis://...
+    """
+    if url.startswith("memory://"):
+        return MemoryCacheBackend()
+    if url.startswith("sqlite:///"):
+        return SQLiteCacheBackend(url[len("sqlite:///"):])
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCacheBackend(url)
+    raise ValueError(f"Unsupported CACHE_URL: {url}")
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_cache() -> CacheBackend:
+    """
+    Return the process-wide cache backend configured by CACHE_URL.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = create_cache_backend(CACHE_URL)
+        return _cache
+
+class RateLimiter:
+    """
+    Fixed-window request limiter on top of a cache backend.
+    Counts are shared between workers when the backend is.
+    """
+
+    def __init__(self, limit: int, window: int = 60, cache: CacheBackend = None):
+        self.limit = limit
+        self.window = window
+        self.cache = cache
+
+    def allow(self, key: str) -> bool:
+        cache = self.cache or get_cache()
+        window_start = int(time.time() // self.window)
+        count = cache.incr(f"ratelimit:{key}:{window_start}", ttl=self.window)
+        return count <= self.limit
+
+_limiter = RateLimiter(RATE_LIMIT_PER_MINUTE)
+
+def rate_limit(request: Request):
+    """
+    Route dependency limiting requests per client per minute.
+    Disabled when RATE_LIMIT_PER_MINUTE is 0.
+    """
+    if _limiter.limit <= 0:
+        return
+    client = request.client.host if request.client else "unknown"
+    try:
+        allowed = _limiter.allow(f"{request.url.path}:{client}")
+    except Exception as e:
+        print(f"Rate limit error: {str(e)}")
+        return  # Fail open if the shared backend is unavailable
+    if not allowed:
+        raise HTTPException(status_code=429, detail="Too many requests, please try again later")
@@ -0,0 +1,94 @@
+import hashlib
+import os
+import re
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "hashed-ngram")
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "384"))
+
+class HashedNgramEmbedder:
+    """
+    Dependency-free fallback embedder.
+    Hashes word tokens and character n-grams into a fixed-size vector.
+    Good enough for testing and rough fuzzy matching, not true semantics.
+    """
+
+    def __init__(self, dim: int = EMBEDDING_DIM, ngram_sizes=(3, 4)):
+        self.name = f"hashed-ngram-{dim}"
+        self.dim = dim
+        self.ngram_sizes = ngram_sizes
+
+    def _features(self, text: str):
+        tokens = re.findall(r"\w+", text.lower())
+        for token in tokens:
+            yield f"w:{token}", 1.0
+            padded = f"<{token}>"
+            for n in self.ngram_sizes:
+                for i in range(len(padded) - n + 1):
+                    yield f"c:{padded[i:i + n]}", 0.5
+
+    def embed(self, texts) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, weight in self._features(text or ""):
+                digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+                bucket = int.from_bytes(digest[:4], "little") % self.dim
+                sign = 1.0 if digest[4] & 1 else -1.0
+                vectors[row, bucket] += sign * weight
+        return vectors
+
+class SentenceTransformerEmbedder:
+    """
+    Local multilingual embedder backed by sentence-transformers.
+    Loaded only when EMBEDDING_MODEL names a sentence-transformers model.
+    """
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name)
+        self.name = model_name
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    def embed(self, texts) -> np.ndarray:
+        vectors = self.model.encode(list(texts), batch_size=32, show_progress_bar=False)
+        return np.asarray(vectors, dtype=np.float32)
+
+_embedder = None
+
+def get_embedder():
+    """
+    Return the configured embedding model (created once per process).
+    Falls back to the hashed n-gram embedder if the model cannot be loaded.
+    """
+    global _embedder
+    if _embedder is None:
+        if EMBEDDING_MODEL == "hashed-ngram":
+            _embedder = HashedNgramEmbedder()
+        else:
+            try:
+                _embedder = SentenceTransformerEmbedder(EMBEDDING_MODEL)
+            except Exception as e:
+                print(f"Embedding model error: {str(e)}, falling back to hashed n-grams")
+                _embedder = HashedNgramEmbedder()
+    return _embedder
+
+def set_embedder(embedder):
+    """
+    Override the embedding model, e.g. with a custom local model.
+    The embedder needs `name`, `dim` and `embed(texts) -> float32 array`.
+    """
+    global _embedder
+    _embedder = embedder
+
+def embed_texts(texts) -> np.ndarray:
+    """
+    Embed texts and L2-normalize so a dot product equals cosine similarity.
+    """
+    vectors = get_embedder().embed(texts).astype(np.float32, copy=False)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
@@ -0,0 +1,222 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# memory:// (single worker), sqlite:///path (workers on one machine)
+# or redis://host:port/db (workers on any node)
+EVENT_BUS_URL = os.getenv("EVENT_BUS_URL", "memory://")
+
+# How long published events stay in the SQLite bus and how often each worker polls it
+EVENT_RETENTION_SECONDS = 300
+EVENT_POLL_INTERVAL = 0.2
+
+def conversation_channel(conversation_id: str) -> str:
+    return f"conversation:{conversation_id}"
+
+class EventBus:
+    """
+    Publish/subscribe delivery of events (JSON-serializable dicts) by channel.
+    publish() is called from request threads, subscriptions are consumed
+    from async handlers.
+    """
+
+    def publish(self, channel: str, event: dict):
+        raise NotImplementedError
+
+    def subscribe(self, channel: str):
+        """
+        Return a subscription with `async get(timeout) -> event or None`
+        and `async close()`. Only events published after subscribing are delivered.
+        """
+        raise NotImplementedError
+
+class MemoryEventBus(EventBus):
+    """
+    In-process bus. Events only reach subscribers in the same worker.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = {}
+
+    def publish(self, channel: str, event: dict):
+        with self.lock:
+            subscriptions = list(self.subscribers.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.loop.call_soon_threadsafe(subscription.queue.put_nowait, event)
+
+    def subscribe(self, channel: str):
+        subscription = MemorySubscription(self, channel)
+        with self.lock:
+            self.subscribers.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription):
+        with self.lock:
+            channel_subscribers = self.subscribers.get(subscription.channel, set())
+            channel_subscribers.discard(subscription)
+            if not channel_subscribers:
+                self.subscribers.pop(subscription.channel, None)
+
+class MemorySubscription:
+    def __init__(self, bus: MemoryEventBus, channel: str):
+        self.bus = bus
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+
+    async def get(self, timeout: float):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self):
+        self.bus._unsubscribe(self)
+
+class SQLiteEventBus(MemoryEventBus):
+    """
+    Bus backed by an events table in a local SQLite file.
+    One poller thread per worker reads new rows and fans them out to the
+    worker's subscribers through in-memory queues, like MemoryEventBus.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.db_lock = threading.Lock()
+        self.conn = self._connect()
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, channel TEXT, payload TEXT, created_at REAL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_events_channel ON events (channel, id)")
+        self._last_prune = 0.0
+        self._poller = None
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def publish(self, channel: str, event: dict):
+        now = time.time()
+        with self.db_lock:
+            self.conn.execute(
+                "INSERT INTO events (channel, payload, created_at) VALUES (?, ?, ?)",
+                (channel, json.dumps(event), now)
+            )
+            if now - self._last_prune > EVENT_RETENTION_SECONDS:
+                self.conn.execute("DELETE FROM events WHERE created_at < ?", (now - EVENT_RETENTION_SECONDS,))
+                self._last_prune = now
+
+    def subscribe(self, channel: str):
+        # No SQLite access here, subscribe() runs on the event loop
+        subscription = super().subscribe(channel)
+        with self.lock:
+            if self._poller is None:
+                self._poller = threading.Thread(target=self._poll, daemon=True)
+                self._poller.start()
+        return subscription
+
+    def _poll(self):
+        """
+        Deliver rows published by any worker to this worker's subscribers.
+        Runs in a daemon thread with its own connection.
+        """
+        conn = self._connect()
+        last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()[0]
+        while True:
+            try:
+                rows = conn.execute(
+                    "SELECT id, channel, payload FROM events WHERE id > ? ORDER BY id", (last_id,)
+                ).fetchall()
+            except sqlite3.Error as e:
+                print(f"Event poll error: {str(e)}")
+                rows = []
+            for row_id, channel, payload in rows:
+                last_id = row_id
+                MemoryEventBus.publish(self, channel, json.loads(payload))
+            time.sleep(EVENT_POLL_INTERVAL)
+
+class RedisEventBus(EventBus):
+    """
+    Bus backed by Redis pub/sub (or any Redis-compatible server).
+    """
+
+    def __init__(self, url: str):
+        import redis
+        import redis.asyncio
+
+        self.url = url
+        self.client = redis.Redis.from_url(url)
+        self.async_client = redis.asyncio.Redis.from_url(url)
+
+    def publish(self, channel: str, event: dict):
+        self.client.publish(channel, json.dumps(event))
+
+    def subscribe(self, channel: str):
+        return RedisSubscription(self.async_client.pubsub(), channel)
+
+class RedisSubscription:
+    def __init__(self, pubsub, channel: str):
+        self.pubsub = pubsub
+        self.channel = channel
+        self.subscribed = False
+
+    async def get(self, timeout: float):
+        if not self.subscribed:
+            await self.pubsub.subscribe(self.channel)
+            self.subscribed = True
+        message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if message is None:
+            return None
+        return json.loads(message["data"])
+
+    async def close(self):
+        await self.pubsub.aclose()
+
+def create_event_bus(url: str) -> EventBus:
+    """
+    Build an event bus from a URL: memory://, sqlite:///path or redis://...
+    """
+    if url.startswith("memory://"):
+        return MemoryEventBus()
+    if url.startswith("sqlite:///"):
+        return SQLiteEventBus(url[len("sqlite:///"):])
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisEventBus(url)
+    raise ValueError(f"Unsupported EVENT_BUS_URL: {url}")
+
+_bus = None
+_bus_lock = threading.Lock()
+
+def get_event_bus() -> EventBus:
+    """
+    Return the process-wide event bus configured by EVENT_BUS_URL.
+    """
+    global _bus
+    with _bus_lock:
+        if _bus is None:
+            _bus = create_event_bus(EVENT_BUS_URL)
+        return _bus
+
+def publish_message_event(message: dict):
+    """
+    Notify every worker that a message was saved. Meant to run as a
+    background task, so errors are logged instead of raised.
+    """
+    try:
+        get_event_bus().publish(
+            conversation_channel(message["conversation_id"]),
+            {"type": "message.created", "message": message}
+        )
+    except Exception as e:
+        print(f"Event publish error: {str(e)}")
@@ -0,0 +1,79 @@
+import os
+import random
+import re
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Simulated model behaviour, tuned through the environment by the benchmarks
+FAKE_MODEL_LATENCY_MS = float(os.getenv("FAKE_MODEL_LATENCY_MS", "200"))
+FAKE_MODEL_JITTER_MS = float(os.getenv("FAKE_MODEL_JITTER_MS", "50"))
+FAKE_MODEL_MS_PER_1K_CHARS = float(os.getenv("FAKE_MODEL_MS_PER_1K_CHARS", "20"))
+FAKE_MODEL_UPLOAD_MS_PER_MB = float(os.getenv("FAKE_MODEL_UPLOAD_MS_PER_MB", "100"))
+FAKE_MODEL_ERROR_RATE = float(os.getenv("FAKE_MODEL_ERROR_RATE", "0"))
+
+TRANSCRIPTS = [
+    "I have had a sharp pain in my chest since this morning.",
+    "The headache gets worse when I look at bright lights.",
+    "I have been coughing at night for about a week.",
+    "Please take one tablet of amoxicillin three times a day.",
+    "My blood sugar readings were high all last week.",
+    "We will repeat the blood test in two weeks.",
+]
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+class FakeUploadedFile:
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
+
+def _simulate_call(extra_ms: float = 0):
+    """
+    Block like a network call to the model, then fail at the configured rate.
+    """
+    delay_ms = random.gauss(FAKE_MODEL_LATENCY_MS, FAKE_MODEL_JITTER_MS) + extra_ms
+    time.sleep(max(0.0, delay_ms) / 1000)
+    if random.random() < FAKE_MODEL_ERROR_RATE:
+        raise RuntimeError("Fake model error (injected)")
+
+def upload_file(path: str) -> FakeUploadedFile:
+    """
+    Stand-in for genai.upload_file.
+    """
+    size = os.path.getsize(path)
+    _simulate_call(size / (1024 * 1024) * FAKE_MODEL_UPLOAD_MS_PER_MB)
+    return FakeUploadedFile(path, size)
+
+class FakeModel:
+    """
+    Stand-in for genai.GenerativeModel with configurable latency and errors.
+    Answers translation, summary and transcription prompts with plausible text.
+    """
+
+    def generate_content(self, contents, safety_settings=None) -> FakeResponse:
+        parts = contents if isinstance(contents, list) else [contents]
+        prompt = "\n".join(p for p in parts if isinstance(p, str))
+        audio = next((p for p in parts if isinstance(p, FakeUploadedFile)), None)
+
+        _simulate_call(len(prompt) / 1000 * FAKE_MODEL_MS_PER_1K_CHARS)
+
+        if audio is not None:
+            return FakeResponse(TRANSCRIPTS[audio.size % len(TRANSCRIPTS)])
+
+        translation = re.search(r"to (.+?)\.\n.*Message to translate:\n\"(.*)\"", prompt, re.S)
+        if translation:
+            target_lang, text = translation.groups()
+            return FakeResponse(f"[{target_lang}] {text}")
+
+        turns = prompt.count("\ndoctor:") + prompt.count("\npatient:")
+        return FakeResponse(
+            "CHIEF COMPLAINT / SYMPTOMS: Reported in the conversation.\n"
+            "DIAGNOSES: Pending further tests.\n"
+            "MEDICATIONS: As discussed.\n"
+            "FOLLOW-UP ACTIONS: Review in two weeks.\n"
+            f"CLINICAL NOTES: Summary generated from {turns} turns."
+        )
@@ -1,16 +1,34 @@
 import google.generativeai as genai
+import hashlib
 import os
 from dotenv import load_dotenv
+from app.services.cache_service import get_cache
 
 load_dotenv()
 
-api_key = os.getenv("GEMINI_API_KEY")
-if not api_key:
-    raise ValueError("GEMINI_API_KEY environment variable is not set")
+# "gemini" in production, "fake" for load tests without network calls
+MODEL_BACKEND = os.getenv("MODEL_BACKEND", "gemini")
 
-genai.configure(api_key=api_key)
+if MODEL_BACKEND == "fake":
+    from app.services.fake_model_service import FakeModel, upload_file
 
-model = genai.GenerativeModel("gemini-2.5-flash")
+    model = FakeModel()
+else:
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        raise ValueError("GEMINI_API_KEY environment variable is not set")
+
+    genai.configure(api_key=api_key)
+
+    model = genai.GenerativeModel("gemini-2.5-flash")
+    upload_file = genai.upload_file
+
+# Repeated phrases ("How are you feeling?") are served from the shared cache
+TRANSLATION_CACHE_TTL = 24 * 60 * 60
+
+def _translation_cache_key(text: str, source_lang: str, target_lang: str) -> str:
+    digest = hashlib.sha256(f"{source_lang}|{target_lang}|{text}".encode("utf-8")).hexdigest()
+    return f"translation:{digest}"
 
 def translate_text(text: str, source_lang: str, target_lang: str) -> str:
     """
@@ -23,6 +41,14 @@ def translate_text(text: str, source_lang: str, target_lang: str) -> str:
     if source_lang == target_lang:
         return text
     
+    cache_key = _translation_cache_key(text, source_lang, target_lang)
+    try:
+        cached = get_cache().get(cache_key)
+        if cached:
+            return cached
+    except Exception as e:
+        print(f"Translation cache error: {str(e)}")
+    
     try:
         prompt = f"""You are a professional medical translator.
 Translate the following medical message from {source_lang} to {target_lang}.
@@ -54,6 +80,11 @@ Message to translate:
         translated = response.text.strip()
         if not translated:
             return text  # Return original if translation fails
+        
+        try:
+            get_cache().set(cache_key, translated, ttl=TRANSLATION_CACHE_TTL)
+        except Exception as e:
+            print(f"Translation cache error: {str(e)}")
         return translated
         
     except Exception as e:
@@ -125,7 +156,7 @@ def transcribe_audio(audio_path: str) -> str:
     """
     try:
         # Upload the file to Gemini (supports audio transcription)
-        audio_file = genai.upload_file(audio_path)
+        audio_file = upload_file(audio_path)
         
         prompt = "Please transcribe this medical conversation audio to text. Preserve all medical terminology accurately."
         
@@ -0,0 +1,325 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+import numpy as np
+from dotenv import load_dotenv
+from app.db.session import SessionLocal
+from app.models.message import Message
+from app.services.embedding_service import embed_texts, get_embedder
+
+try:
+    import fcntl
+except ImportError:  # Windows, single-process development only
+    fcntl = None
+
+load_dotenv()
+
+SEMANTIC_SEARCH_ENABLED = os.getenv("SEMANTIC_SEARCH_ENABLED", "true").lower() == "true"
+VECTOR_INDEX_DIR = os.getenv("VECTOR_INDEX_DIR", "vector_index")
+
+# Rows scored per matrix multiply, keeps peak memory flat on large indexes
+SEARCH_CHUNK_ROWS = 65536
+BACKFILL_BATCH_SIZE = 256
+
+class VectorIndex:
+    """
+    Append-only embedding index stored on disk.
+
+    - embeddings.f32: float32 matrix, one L2-normalized row per message (memory-mapped for search)
+    - ids.jsonl: message_id / conversation_id for each row, in the same order
+    - meta.json: embedding model name and dimension; the index is reset if they change
+
+    Several worker processes can share one index directory. Appends hold an
+    exclusive file lock and every reader picks up rows written by other
+    workers before searching.
+    """
+
+    def __init__(self, directory: str, dim: int, model_name: str):
+        self.directory = directory
+        self.dim = dim
+        self.model_name = model_name
+        self.matrix_path = os.path.join(directory, "embeddings.f32")
+        self.ids_path = os.path.join(directory, "ids.jsonl")
+        self.meta_path = os.path.join(directory, "meta.json")
+        self.lock_path = os.path.join(directory, ".lock")
+        self.backfill_lock_path = os.path.join(directory, ".backfill.lock")
+        self.lock = threading.Lock()
+
+        self.message_ids = []
+        self.conversation_rows = {}
+        self._id_set = set()
+        self._ids_offset = 0
+        self._matrix = None
+
+        os.makedirs(directory, exist_ok=True)
+        with self.lock, self._file_lock(exclusive=True):
+            self._load()
+            self._refresh()
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        """
+        Cross-process lock on the index directory (no-op where fcntl is unavailable).
+        """
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_path, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    @contextmanager
+    def backfill_lock(self):
+        """
+        Non-blocking cross-process lock so only one worker runs a backfill.
+        Yields True if this process holds the lock, False if another one does.
+        """
+        if fcntl is None:
+            yield True
+            return
+        with open(self.backfill_lock_path, "a") as f:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _load(self):
+        meta = {}
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path) as f:
+                meta = json.load(f)
+
+        if meta.get("model") != self.model_name or meta.get("dim") != self.dim:
+            self._reset()
+            return
+
+        for path in (self.matrix_path, self.ids_path):
+            if not os.path.exists(path):
+                open(path, "wb").close()
+
+        entries = []
+        with open(self.ids_path) as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break  # Partially written line from an interrupted append
+
+        # Keep only rows present in both files in case a write was interrupted
+        row_bytes = self.dim * 4
+        matrix_rows = os.path.getsize(self.matrix_path) // row_bytes
+        count = min(len(entries), matrix_rows)
+        if count != len(entries) or count * row_bytes != os.path.getsize(self.matrix_path):
+            with open(self.matrix_path, "r+b") as f:
+                f.truncate(count * row_bytes)
+            with open(self.ids_path, "w") as f:
+                for entry in entries[:count]:
+                    f.write(json.dumps(entry) + "\n")
+
+    def _reset(self):
+        for path in (self.matrix_path, self.ids_path):
+            open(path, "wb").close()
+        with open(self.meta_path, "w") as f:
+            json.dump({"model": self.model_name, "dim": self.dim}, f)
+
+    def _refresh(self):
+        """
+        Track rows appended to ids.jsonl since the last read, including
+        rows written by other processes. Caller holds the file lock.
+        """
+        with open(self.ids_path, "rb") as f:
+            f.seek(self._ids_offset)
+            data = f.read()
+        complete = data[:data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            entry = json.loads(line)
+            self._track(entry["id"], entry["conversation_id"])
+        self._ids_offset += len(complete)
+
+    def _track(self, message_id: str, conversation_id: str):
+        row = len(self.message_ids)
+        self.message_ids.append(message_id)
+        self.conversation_rows.setdefault(conversation_id, []).append(row)
+        self._id_set.add(message_id)
+
+    def __len__(self):
+        return len(self.message_ids)
+
+    def __contains__(self, message_id):
+        return message_id in self._id_set
+
+    def add(self, message_ids, conversation_ids, vectors: np.ndarray) -> int:
+        """
+        Append embeddings for new messages. Already indexed ids are skipped.
+        Returns the number of rows added.
+        """
+        with self.lock, self._file_lock(exclusive=True):
+            self._refresh()
+            keep = [i for i, message_id in enumerate(message_ids) if message_id not in self._id_set]
+            if not keep:
+                return 0
+
+            rows = np.ascontiguousarray(vectors[keep], dtype=np.float32)
+            lines = b"".join(
+                (json.dumps({"id": message_ids[i], "conversation_id": conversation_ids[i]}) + "\n").encode("utf-8")
+                for i in keep
+            )
+            # Matrix rows go first so readers never see an id without its vector.
+            # Row positions follow ids.jsonl, so drop any rows left behind by an
+            # append that died before its ids were written.
+            with open(self.matrix_path, "r+b") as f:
+                f.truncate(len(self.message_ids) * self.dim * 4)
+                f.seek(0, os.SEEK_END)
+                f.write(rows.tobytes())
+            with open(self.ids_path, "ab") as f:
+                f.write(lines)
+
+            for i in keep:
+                self._track(message_ids[i], conversation_ids[i])
+            self._ids_offset += len(lines)
+            return len(keep)
+
+    def _matrix_view(self, count: int) -> np.ndarray:
+        if self._matrix is None or self._matrix.shape[0] != count:
+            self._matrix = np.memmap(self.matrix_path, dtype=np.float32, mode="r", shape=(count, self.dim))
+        return self._matrix
+
+    def search(self, query_vectors: np.ndarray, top_k: int = 10, conversation_id: str = None, min_score: float = 0.0):
+        """
+        Top-k cosine similarity for a batch of normalized query vectors.
+        Returns one list of (message_id, score) per query, best first,
+        keeping only hits that score above `min_score`.
+        """
+        with self.lock:
+            with self._file_lock(exclusive=False):
+                self._refresh()
+            count = len(self.message_ids)
+            if count == 0:
+                return [[] for _ in range(len(query_vectors))]
+            matrix = self._matrix_view(count)
+            candidate_rows = None
+            if conversation_id:
+                candidate_rows = np.asarray(self.conversation_rows.get(conversation_id, []), dtype=np.int64)
+            message_ids = self.message_ids
+
+        total = count if candidate_rows is None else len(candidate_rows)
+        if total == 0:
+            return [[] for _ in range(len(query_vectors))]
+
+        queries = np.asarray(query_vectors, dtype=np.float32)
+        k = min(top_k, total)
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+
+        for start in range(0, total, SEARCH_CHUNK_ROWS):
+            end = min(start + SEARCH_CHUNK_ROWS, total)
+            if candidate_rows is None:
+                rows = np.arange(start, end, dtype=np.int64)
+                block = matrix[start:end]
+            else:
+                rows = candidate_rows[start:end]
+                block = matrix[rows]
+
+            scores = queries @ block.T
+            best_scores = np.concatenate([best_scores, scores], axis=1)
+            best_rows = np.concatenate([best_rows, np.broadcast_to(rows, scores.shape)], axis=1)
+
+            if best_scores.shape[1] > k:
+                top = np.argpartition(-best_scores, k - 1, axis=1)[:, :k]
+                best_scores = np.take_along_axis(best_scores, top, axis=1)
+                best_rows = np.take_along_axis(best_rows, top, axis=1)
+
+        order = np.argsort(-best_scores, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        best_rows = np.take_along_axis(best_rows, order, axis=1)
+
+        return [
+            [(message_ids[row], float(score)) for row, score in zip(rows, scores) if score > min_score]
+            for rows, scores in zip(best_rows, best_scores)
+        ]
+
+_index = None
+_index_lock = threading.Lock()
+
+def get_vector_index() -> VectorIndex:
+    """
+    Return the process-wide vector index for the configured embedding model.
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            embedder = get_embedder()
+            _index = VectorIndex(VECTOR_INDEX_DIR, embedder.dim, embedder.name)
+        return _index
+
+def message_text(original_text: str, translated_text: str) -> str:
+    """
+    Text embedded for a message. Both sides are included so a query
+    in either conversation language can match.
+    """
+    return "\n".join(t for t in (original_text, translated_text) if t)
+
+def index_message(message_id: str, conversation_id: str, original_text: str, translated_text: str):
+    """
+    Embed and index a single new message. Meant to run as a background task,
+    so errors are logged instead of raised.
+    """
+    if not SEMANTIC_SEARCH_ENABLED:
+        return
+    try:
+        vectors = embed_texts([message_text(original_text, translated_text)])
+        get_vector_index().add([message_id], [conversation_id], vectors)
+    except Exception as e:
+        print(f"Indexing error: {str(e)}")
+
+def backfill_index() -> int:
+    """
+    Embed every stored message that is not in the index yet.
+    Returns the number of messages indexed.
+    """
+    if not SEMANTIC_SEARCH_ENABLED:
+        return 0
+
+    index = get_vector_index()
+    indexed = 0
+    with index.backfill_lock() as acquired:
+        if not acquired:
+            return 0  # Another worker is already backfilling
+
+        db = SessionLocal()
+        try:
+            # Keyset pagination on the primary key, stays fast on large tables.
+            # Order does not matter for a backfill, and created_at is stored by
+            # SQLite in a format that does not compare reliably with bound datetimes.
+            last_id = None
+            while True:
+                query = db.query(Message)
+                if last_id is not None:
+                    query = query.filter(Message.id > last_id)
+                batch = query.order_by(Message.id).limit(BACKFILL_BATCH_SIZE).all()
+                if not batch:
+                    break
+                last_id = batch[-1].id
+
+                missing = [m for m in batch if m.id not in index]
+                if missing:
+                    vectors = embed_texts([message_text(m.original_text, m.translated_text) for m in missing])
+                    indexed += index.add(
+                        [m.id for m in missing],
+                        [m.conversation_id for m in missing],
+                        vectors
+                    )
+        except Exception as e:
+            print(f"Backfill error: {str(e)}")
+        finally:
+            db.close()
+    return indexed
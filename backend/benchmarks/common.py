@@ -0,0 +1,149 @@
+"""
+Helpers shared by the benchmarks: temporary app environment, seeding,
+server lifecycle, percentiles and memory sampling.
+"""
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SEED_SCRIPT = """
+import json
+import sys
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.models.message import Message
+from app.services.vector_index_service import backfill_index
+
+Base.metadata.create_all(bind=engine)
+db = SessionLocal()
+for conversation in json.load(sys.stdin):
+    for m in conversation["messages"]:
+        db.add(Message(conversation_id=conversation["conversation_id"], role=m["role"],
+                       original_text=m["original_text"], translated_text=m["translated_text"]))
+db.commit()
+db.close()
+print(backfill_index())
+"""
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def bench_env(workdir: str, **overrides) -> dict:
+    """
+    Environment for an app instance whose database, index, cache and event
+    bus all live in `workdir`, talking to the fake model backend.
+    """
+    env = dict(os.environ)
+    env.update({
+        "PYTHONPATH": BACKEND_DIR,
+        "DATABASE_URL": f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        "VECTOR_INDEX_DIR": os.path.join(workdir, "vector_index"),
+        "CACHE_URL": f"sqlite:///{os.path.join(workdir, 'cache.db')}",
+        "EVENT_BUS_URL": f"sqlite:///{os.path.join(workdir, 'events.db')}",
+        "MODEL_BACKEND": "fake",
+        "RATE_LIMIT_PER_MINUTE": "0",
+    })
+    env.update({key: str(value) for key, value in overrides.items()})
+    return env
+
+def seed_database(env: dict, workdir: str, conversations) -> int:
+    """
+    Insert conversations and build the semantic index in a child process,
+    so this process never imports the app with the wrong settings.
+    Returns the number of indexed messages.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", SEED_SCRIPT], cwd=workdir, env=env, check=True,
+        input=json.dumps(conversations), capture_output=True, text=True
+    )
+    return int(result.stdout.strip().splitlines()[-1])
+
+def start_server(env: dict, workdir: str, workers: int) -> tuple:
+    """
+    Start gunicorn in `workdir` (uploads land there too) and wait for /health.
+    Returns (process, base_url).
+    """
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", os.path.join(BACKEND_DIR, "gunicorn.conf.py"),
+         "--bind", f"127.0.0.1:{port}", "--access-logfile", "/dev/null", "app.main:app"],
+        cwd=workdir, env=dict(env, WEB_CONCURRENCY=str(workers)),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_until_up(base_url, server)
+    except Exception:
+        stop_server(server)
+        raise
+    return server, base_url
+
+def wait_until_up(base_url: str, server=None, timeout: float = 60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if server is not None and server.poll() is not None:
+            raise RuntimeError(f"Server exited with code {server.returncode}")
+        try:
+            with urllib.request.urlopen(f"{base_url}/health", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("Server did not start in time")
+
+def stop_server(server):
+    server.terminate()
+    try:
+        server.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+def percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def process_tree_rss(pid: int):
+    """
+    Resident memory in bytes of a process and all its descendants
+    (gunicorn master plus workers). Returns None where /proc is unavailable.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces, fields resume after ")"
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            continue
+    return total
@@ -0,0 +1,377 @@
+"""
+End-to-end load test against a temporary app instance.
+
+Starts the app (gunicorn, fake model backend with configurable latency and
+error rate) on a temporary database seeded with synthetic clinical
+conversations, then drives a mixed workload of message sends, audio uploads,
+searches and summaries at each target concurrency. Reports p50/p95/p99
+latency, throughput, error counts and server RSS as JSON, and optionally
+compares against a saved baseline (exit code 1 on regression).
+
+Usage (from backend/):
+    python -m benchmarks.load_test --concurrency 1,8,32 --duration 20 --output results.json
+    python -m benchmarks.load_test --save-baseline baseline.json
+    python -m benchmarks.load_test --baseline baseline.json --tolerance 0.15
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import requests
+
+from benchmarks import synthetic
+from benchmarks.common import (
+    BACKEND_DIR,
+    bench_env,
+    percentile,
+    process_tree_rss,
+    seed_database,
+    start_server,
+    stop_server,
+)
+
+OPERATIONS = ["send", "upload", "search", "semantic_search", "summarize"]
+DEFAULT_MIX = "send=50,upload=10,search=20,semantic_search=10,summarize=10"
+
+# Metrics compared against the baseline and whether a higher value is worse
+COMPARED_METRICS = {"throughput_rps": False, "p50_ms": True, "p95_ms": True, "p99_ms": True, "error_rate": True}
+# Compared by absolute difference, since the baseline value is often 0
+ABSOLUTE_METRICS = {"error_rate"}
+
+# Bodies the app returns with status 200 when the model call failed
+SUMMARY_FALLBACKS = ("Error generating summary", "Unable to generate summary")
+
+def parse_mix(text: str) -> dict:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation '{name}', expected one of {', '.join(OPERATIONS)}")
+        mix[name] = float(weight)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+def run_operation(session: requests.Session, base_url: str, op: str, rng: random.Random, conversation_ids, audio_clips) -> bool:
+    """
+    Send one request. Returns True if the server answered without an error
+    status and without a fallback body (untranslated text, failed summary).
+    """
+    conversation_id = rng.choice(conversation_ids)
+    source, target = rng.choice(synthetic.LANGUAGE_PAIRS)
+    role = rng.choice(["doctor", "patient"])
+
+    if op == "send":
+        response = session.post(f"{base_url}/messages", json={
+            "conversation_id": conversation_id,
+            "role": role,
+            "source_language": source,
+            "target_language": target,
+            "text": synthetic.message_text(role, rng),
+        }, timeout=60)
+    elif op == "upload":
+        response = session.post(f"{base_url}/audio", data={
+            "conversation_id": conversation_id,
+            "role": role,
+            "source_language": source,
+            "target_language": target,
+        }, files={"audio": ("recording.wav", rng.choice(audio_clips), "audio/wav")}, timeout=60)
+    elif op == "search":
+        params = {"query": rng.choice(synthetic.SEARCH_QUERIES)}
+        if rng.random() < 0.5:
+            params["conversation_id"] = conversation_id
+        response = session.get(f"{base_url}/search", params=params, timeout=60)
+    elif op == "semantic_search":
+        params = {"query": rng.choice(synthetic.SEMANTIC_QUERIES), "top_k": 10}
+        if rng.random() < 0.5:
+            params["conversation_id"] = conversation_id
+        response = session.get(f"{base_url}/search/semantic", params=params, timeout=60)
+    else:
+        response = session.get(f"{base_url}/summary", params={
+            "conversation_id": conversation_id,
+            "target_language": target,
+        }, timeout=120)
+
+    if response.status_code >= 400:
+        return False
+    if op in ("send", "upload"):
+        message = response.json()["message"]
+        return source == target or message["translated_text"] != message["original_text"]
+    if op == "summarize":
+        return not response.json()["summary"].startswith(SUMMARY_FALLBACKS)
+    return True
+
+def client_process(base_url: str, threads: int, warmup: float, duration: float, mix: dict,
+                   seed: int, conversation_ids, audio_clips) -> dict:
+    """
+    Run `threads` closed-loop clients. Requests started during the warmup
+    are not recorded. Returns {op: {"latencies": [...], "errors": n}}.
+    """
+    measure_from = time.time() + warmup
+    deadline = measure_from + duration
+    ops, weights = list(mix), list(mix.values())
+
+    def loop(thread_id):
+        rng = random.Random(seed * 1000 + thread_id)
+        session = requests.Session()
+        stats = {op: {"latencies": [], "errors": 0} for op in ops}
+        while time.time() < deadline:
+            op = rng.choices(ops, weights)[0]
+            recorded = time.time() >= measure_from
+            started = time.perf_counter()
+            try:
+                ok = run_operation(session, base_url, op, rng, conversation_ids, audio_clips)
+            except (requests.RequestException, ValueError, KeyError):
+                ok = False  # Connection failure or malformed response body
+            elapsed = time.perf_counter() - started
+            if recorded:
+                stats[op]["latencies"].append(elapsed)
+                if not ok:
+                    stats[op]["errors"] += 1
+        session.close()
+        return stats
+
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(pool.map(loop, range(threads)))
+
+    merged = {op: {"latencies": [], "errors": 0} for op in ops}
+    for stats in results:
+        for op, values in stats.items():
+            merged[op]["latencies"].extend(values["latencies"])
+            merged[op]["errors"] += values["errors"]
+    return merged
+
+def latency_stats(latencies, errors: int, duration: float) -> dict:
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "error_rate": round(errors / len(latencies), 4) if latencies else 0.0,
+        "throughput_rps": round(len(latencies) / duration, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(max(latencies) * 1000, 2) if latencies else 0.0,
+    }
+
+class RSSSampler(threading.Thread):
+    """
+    Samples server memory (master plus workers) while a level runs.
+    """
+
+    def __init__(self, pid: int, interval: float = 0.5):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.is_set():
+            rss = process_tree_rss(self.pid)
+            if rss is not None:
+                self.samples.append(rss)
+            self.stopped.wait(self.interval)
+
+    def stop(self) -> dict:
+        self.stopped.set()
+        self.join()
+        if not self.samples:
+            return {"start_mb": None, "peak_mb": None, "end_mb": None}
+        mb = [round(sample / (1024 * 1024), 1) for sample in self.samples]
+        return {"start_mb": mb[0], "peak_mb": max(mb), "end_mb": mb[-1]}
+
+def run_level(server, base_url: str, concurrency: int, args, mix: dict, conversation_ids, audio_clips) -> dict:
+    client_processes = max(1, min(args.client_processes, concurrency))
+    threads = [concurrency // client_processes + (1 if i < concurrency % client_processes else 0)
+               for i in range(client_processes)]
+
+    sampler = RSSSampler(server.pid)
+    sampler.start()
+    with ProcessPoolExecutor(client_processes) as pool:
+        futures = [
+            pool.submit(client_process, base_url, threads[i], args.warmup, args.duration, mix,
+                        args.seed + concurrency * 100 + i, conversation_ids, audio_clips)
+            for i in range(client_processes)
+        ]
+        results = [f.result() for f in futures]
+    rss = sampler.stop()
+
+    operations = {}
+    all_latencies, all_errors = [], 0
+    for op in mix:
+        latencies = [l for result in results for l in result[op]["latencies"]]
+        errors = sum(result[op]["errors"] for result in results)
+        operations[op] = latency_stats(latencies, errors, args.duration)
+        all_latencies.extend(latencies)
+        all_errors += errors
+
+    return {
+        "concurrency": concurrency,
+        "overall": latency_stats(all_latencies, all_errors, args.duration),
+        "operations": operations,
+        "rss": rss,
+    }
+
+def compare(results: dict, baseline: dict, tolerance: float, error_rate_tolerance: float):
+    """
+    Compare each level/operation with the baseline run.
+    Returns (rows, regressions) where a regression is a relative change worse
+    than `tolerance`, or for error_rate an absolute increase above `error_rate_tolerance`.
+    """
+    baseline_levels = {level["concurrency"]: level for level in baseline.get("levels", [])}
+    rows, regressions = [], []
+
+    for level in results["levels"]:
+        base_level = baseline_levels.get(level["concurrency"])
+        if not base_level:
+            continue
+        scopes = [("overall", level["overall"], base_level["overall"])]
+        scopes += [
+            (op, stats, base_level["operations"][op])
+            for op, stats in level["operations"].items()
+            if op in base_level["operations"]
+        ]
+        for name, current, previous in scopes:
+            for metric, higher_is_worse in COMPARED_METRICS.items():
+                before, after = previous.get(metric), current.get(metric)
+                if before is None or after is None:
+                    continue
+                if metric in ABSOLUTE_METRICS:
+                    change = after - before
+                    regressed = change > error_rate_tolerance
+                else:
+                    if not before:
+                        continue
+                    change = (after - before) / before
+                    regressed = change > tolerance if higher_is_worse else change < -tolerance
+                row = {
+                    "concurrency": level["concurrency"],
+                    "scope": name,
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "change": round(change, 4),
+                    "regression": regressed,
+                }
+                rows.append(row)
+                if regressed:
+                    regressions.append(row)
+
+    return rows, regressions
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_report(results: dict, regressions):
+    for level in results["levels"]:
+        overall = level["overall"]
+        print(f"\nconcurrency {level['concurrency']}: {overall['throughput_rps']} req/s, "
+              f"p50 {overall['p50_ms']} ms, p95 {overall['p95_ms']} ms, p99 {overall['p99_ms']} ms, "
+              f"errors {overall['errors']}, peak RSS {level['rss']['peak_mb']} MB", file=sys.stderr)
+        for op, stats in level["operations"].items():
+            print(f"  {op:<16} {stats['requests']:>6} req  p50 {stats['p50_ms']:>8} ms  "
+                  f"p95 {stats['p95_ms']:>8} ms  p99 {stats['p99_ms']:>8} ms  errors {stats['errors']}", file=sys.stderr)
+    for row in regressions:
+        change = f"{row['change']:+.4f}" if row["metric"] in ABSOLUTE_METRICS else f"{row['change']:+.1%}"
+        print(f"REGRESSION c={row['concurrency']} {row['scope']} {row['metric']}: "
+              f"{row['baseline']} -> {row['current']} ({change})", file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated concurrency levels")
+    parser.add_argument("--duration", type=float, default=20, help="Measured seconds per level")
+    parser.add_argument("--warmup", type=float, default=3, help="Unrecorded seconds before each level")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Operation weights, e.g. send=50,search=50")
+    parser.add_argument("--workers", type=int, default=1, help="Server worker processes")
+    parser.add_argument("--client-processes", type=int, default=4, help="Load generator processes")
+    parser.add_argument("--conversations", type=int, default=200, help="Seeded conversations")
+    parser.add_argument("--audio-clips", type=int, default=8, help="Distinct synthetic audio clips")
+    parser.add_argument("--model-latency-ms", type=float, default=200, help="Mean fake model latency")
+    parser.add_argument("--model-jitter-ms", type=float, default=50, help="Fake model latency std deviation")
+    parser.add_argument("--model-error-rate", type=float, default=0.0, help="Fraction of failing model calls")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for data and workload")
+    parser.add_argument("--output", help="Write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="Compare against this results JSON")
+    parser.add_argument("--save-baseline", help="Also write results JSON here for later comparison")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative change before a regression")
+    parser.add_argument("--error-rate-tolerance", type=float, default=0.01,
+                        help="Allowed absolute increase in error rate before a regression")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    levels = [int(c) for c in args.concurrency.split(",")]
+    rng = random.Random(args.seed)
+    conversations = synthetic.conversations(args.conversations, rng)
+    conversation_ids = [c["conversation_id"] for c in conversations]
+    audio_clips = [synthetic.audio_wav(rng) for _ in range(args.audio_clips)] if "upload" in mix else []
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": vars(args),
+        },
+        "levels": [],
+    }
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = bench_env(
+            workdir,
+            FAKE_MODEL_LATENCY_MS=args.model_latency_ms,
+            FAKE_MODEL_JITTER_MS=args.model_jitter_ms,
+            FAKE_MODEL_ERROR_RATE=args.model_error_rate,
+        )
+        results["meta"]["seeded_messages"] = seed_database(env, workdir, conversations)
+
+        server, base_url = start_server(env, workdir, args.workers)
+        try:
+            for concurrency in levels:
+                results["levels"].append(run_level(server, base_url, concurrency, args, mix, conversation_ids, audio_clips))
+        finally:
+            stop_server(server)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows, regressions = compare(results, baseline, args.tolerance, args.error_rate_tolerance)
+        results["comparison"] = {
+            "baseline": args.baseline,
+            "baseline_commit": baseline.get("meta", {}).get("git_commit"),
+            "tolerance": args.tolerance,
+            "error_rate_tolerance": args.error_rate_tolerance,
+            "rows": rows,
+            "regressions": len(regressions),
+        }
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            f.write(output + "\n")
+
+    print_report(results, regressions)
+    if regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Synthetic clinical conversations and audio for the benchmarks.
+Everything is generated from a seeded random.Random so runs are repeatable.
+"""
+import io
+import math
+import random
+import struct
+import wave
+
+LANGUAGE_PAIRS = [
+    ("English", "Spanish"), ("Spanish", "English"), ("English", "Hindi"),
+    ("Hindi", "English"), ("English", "French"), ("French", "English"),
+]
+
+SYMPTOMS = [
+    "chest pain", "tightness in my chest", "a headache", "a fever", "a dry cough",
+    "shortness of breath", "stomach pain", "dizziness", "back pain", "a sore throat",
+    "nausea", "a rash on my arm", "swelling in my ankles", "trouble sleeping",
+]
+DURATIONS = ["since this morning", "for two days", "for about a week", "on and off for a month", "since last night"]
+TRIGGERS = ["when I climb stairs", "after eating", "at night", "when I lie down", "in the morning", "all the time"]
+MEDICATIONS = ["paracetamol", "ibuprofen", "amoxicillin", "omeprazole", "salbutamol", "metformin", "cetirizine"]
+FREQUENCIES = ["once a day", "twice a day", "three times a day", "every eight hours", "before bed"]
+TESTS = ["a blood test", "an ECG", "a chest X-ray", "a urine test", "an ultrasound"]
+
+PATIENT_LINES = [
+    "I have had {symptom} {duration}.",
+    "It gets worse {trigger}.",
+    "On a scale of one to ten the pain is about {severity}.",
+    "I already tried {medication} but it did not help much.",
+    "I am allergic to {medication}.",
+    "Should I be worried about {symptom}?",
+    "Yes, I also have {symptom}.",
+]
+DOCTOR_LINES = [
+    "How long have you had {symptom}?",
+    "Does it get worse {trigger}?",
+    "Are you taking any medication at the moment?",
+    "I would like to order {test} to rule out anything serious.",
+    "Please take {medication} {frequency} for {days} days.",
+    "Come back for a follow-up in {weeks} weeks, or sooner if it gets worse.",
+    "Your results look normal, but keep an eye on {symptom}.",
+]
+
+SEARCH_QUERIES = [
+    "chest pain", "fever", "headache", "cough", "medication", "allergic", "blood test",
+    "follow-up", "breath", "twice a day",
+]
+SEMANTIC_QUERIES = [
+    "tightness in my chest", "pain when breathing", "high temperature", "trouble sleeping at night",
+    "what antibiotics were prescribed", "when is the next appointment", "dolor de pecho", "fièvre",
+]
+
+def _fill(template: str, rng: random.Random) -> str:
+    return template.format(
+        symptom=rng.choice(SYMPTOMS),
+        duration=rng.choice(DURATIONS),
+        trigger=rng.choice(TRIGGERS),
+        severity=rng.randint(2, 9),
+        medication=rng.choice(MEDICATIONS),
+        frequency=rng.choice(FREQUENCIES),
+        test=rng.choice(TESTS),
+        days=rng.choice([3, 5, 7, 10, 14]),
+        weeks=rng.choice([1, 2, 4, 6]),
+    )
+
+def message_text(role: str, rng: random.Random) -> str:
+    lines = PATIENT_LINES if role == "patient" else DOCTOR_LINES
+    return " ".join(_fill(rng.choice(lines), rng) for _ in range(rng.randint(1, 3)))
+
+def conversation(conversation_id: str, rng: random.Random, turns: int):
+    """
+    Alternating patient/doctor messages, stored as if already translated.
+    """
+    source, target = rng.choice(LANGUAGE_PAIRS)
+    messages = []
+    for turn in range(turns):
+        role = "patient" if turn % 2 == 0 else "doctor"
+        text = message_text(role, rng)
+        messages.append({
+            "role": role,
+            "original_text": text,
+            "translated_text": f"[{target if role == 'patient' else source}] {text}",
+        })
+    return {"conversation_id": conversation_id, "messages": messages}
+
+def conversations(count: int, rng: random.Random, min_turns: int = 6, max_turns: int = 30):
+    return [conversation(f"bench-{i}", rng, rng.randint(min_turns, max_turns)) for i in range(count)]
+
+def audio_wav(rng: random.Random, min_seconds: float = 1.0, max_seconds: float = 6.0, sample_rate: int = 16000) -> bytes:
+    """
+    Mono 16-bit WAV with a speech-like mix of tones and noise,
+    sized like a short recorded utterance.
+    """
+    seconds = rng.uniform(min_seconds, max_seconds)
+    base = rng.uniform(100, 250)
+    frames = bytearray()
+    for i in range(int(seconds * sample_rate)):
+        t = i / sample_rate
+        envelope = 0.5 + 0.5 * math.sin(2 * math.pi * 3 * t)  # Syllable-rate amplitude changes
+        sample = envelope * (
+            0.6 * math.sin(2 * math.pi * base * t)
+            + 0.3 * math.sin(2 * math.pi * base * 2.5 * t)
+        ) + 0.1 * rng.uniform(-1, 1)
+        frames += struct.pack("<h", int(max(-1.0, min(1.0, sample)) * 32767 * 0.8))
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(bytes(frames))
+    return buffer.getvalue()
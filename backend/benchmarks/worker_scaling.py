@@ -0,0 +1,97 @@
+"""
+Throughput vs. number of gunicorn workers.
+
+Seeds a temporary database and semantic index, starts the app with 1, 2, 4...
+workers and drives concurrent GET /search/semantic requests (CPU-bound, no
+Gemini calls) from several client processes. Prints one JSON line per run.
+
+Usage (from backend/):
+    python -m benchmarks.worker_scaling --workers 1,2,4 --concurrency 32 --duration 10
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from benchmarks import synthetic
+from benchmarks.common import bench_env, percentile, seed_database, start_server, stop_server
+
+def client_process(base_url: str, threads: int, duration: float, seed_value: int):
+    """
+    Run `threads` closed-loop clients for `duration` seconds.
+    Returns (latencies in seconds, error count).
+    """
+    deadline = time.time() + duration
+
+    def loop(thread_id):
+        rng = random.Random(seed_value * 1000 + thread_id)
+        latencies, errors = [], 0
+        while time.time() < deadline:
+            query = urllib.parse.urlencode({"query": rng.choice(synthetic.SEMANTIC_QUERIES), "top_k": 10})
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(f"{base_url}/search/semantic?{query}", timeout=30) as response:
+                    response.read()
+                latencies.append(time.perf_counter() - started)
+            except OSError:
+                errors += 1
+        return latencies, errors
+
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(pool.map(loop, range(threads)))
+    return [l for latencies, _ in results for l in latencies], sum(e for _, e in results)
+
+def run(workers: int, env: dict, workdir: str, concurrency: int, duration: float, client_processes: int) -> dict:
+    server, base_url = start_server(env, workdir, workers)
+    try:
+        threads = max(1, concurrency // client_processes)
+        with ProcessPoolExecutor(client_processes) as pool:
+            futures = [pool.submit(client_process, base_url, threads, duration, i) for i in range(client_processes)]
+            results = [f.result() for f in futures]
+    finally:
+        stop_server(server)
+
+    latencies = [l for batch, _ in results for l in batch]
+    errors = sum(e for _, e in results)
+    return {
+        "workers": workers,
+        "concurrency": threads * client_processes,
+        "duration_s": duration,
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / duration, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent client connections")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds per run")
+    parser.add_argument("--client-processes", type=int, default=4, help="Load generator processes")
+    parser.add_argument("--conversations", type=int, default=250, help="Seeded conversations")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = bench_env(workdir)
+        seed_database(env, workdir, synthetic.conversations(args.conversations, random.Random(0)))
+
+        results = []
+        for workers in [int(w) for w in args.workers.split(",")]:
+            result = run(workers, env, workdir, args.concurrency, args.duration, args.client_processes)
+            results.append(result)
+            print(json.dumps(result), flush=True)
+
+        baseline = results[0]["throughput_rps"] or 1
+        for result in results:
+            print(f"{result['workers']} worker(s): {result['throughput_rps']} req/s "
+                  f"({result['throughput_rps'] / baseline:.2f}x), p95 {result['p95_ms']} ms", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import multiprocessing
+import os
+
+# Multi-worker deployment: gunicorn manages uvicorn worker processes.
+# Run with: gunicorn -c gunicorn.conf.py app.main:app
+
+bind = f"0.0.0.0:{os.getenv('PORT', '10000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Transcription and summary calls to Gemini can take a while
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+# Trust X-Forwarded-For from these proxy addresses so request.client is the
+# real client (needed for per-client rate limits). Use "*" behind a platform
+# load balancer such as Render's, where the app is not reachable directly.
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1,::1")
+
+# Import the app (and create tables) once in the master before forking
+preload_app = True
+accesslog = "-"
+
+# In-process caches and events are not visible to other workers, so default
+# to the SQLite-shared backends. Set CACHE_URL / EVENT_BUS_URL to redis://...
+# when running on more than one node.
+if workers > 1:
+    os.environ.setdefault("CACHE_URL", "sqlite:///./shared_cache.db")
+    os.environ.setdefault("EVENT_BUS_URL", "sqlite:///./shared_events.db")
+
+def post_fork(server, worker):
+    # Connections opened in the master must not be shared with workers
+    from app.db.session import engine
+
+    engine.dispose(close=False)